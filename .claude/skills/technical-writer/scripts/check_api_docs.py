@@ -6,13 +6,14 @@ This script analyzes Rust source code to identify public APIs (pub functions,
 types, methods) and verifies they have proper documentation comments.
 
 Usage:
-    python check_api_docs.py [--path PATH] [--format FORMAT] [--strict]
+    python check_api_docs.py [--path PATH] [--format FORMAT] [--strict] [--jobs N]
 
 Options:
     --path PATH     Path to check (default: crates/)
     --format FORMAT Output format: text, json, markdown (default: text)
     --strict        Fail if any undocumented exports are found
     --threshold     Minimum documentation coverage percentage (default: 0)
+    --jobs N        Number of worker processes (default: CPU count, 1 = serial)
 
 Exit codes:
     0 - All public APIs are documented (or not in strict mode)
@@ -22,14 +23,19 @@ Exit codes:
 
 import argparse
 import json
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Optional
 
-@dataclass
+# Below this many files, forking worker processes costs more than it saves
+PARALLEL_MIN_FILES = 16
+
+@dataclass(slots=True, frozen=True)
 class PublicAPI:
     """Represents a public API element."""
     file_path: str
@@ -41,172 +47,149 @@ class PublicAPI:
     doc_comment: Optional[str] = None
 
 
-def is_rust_public(line: str) -> bool:
-    """Check if a Rust item is public (starts with 'pub')."""
-    return bool(re.match(r'^\s*pub\s+', line))
-
-
-def extract_doc_comment(lines: List[str], target_line: int) -> Tuple[bool, Optional[str]]:
-    """Extract documentation comment preceding a declaration."""
+# Bytes \w is ASCII-only; [\x80-\xff] keeps non-ASCII identifiers whole
+_RUST_NAME_RE = re.compile(rb'((?:\w|[\x80-\xff])+)')
+_RUST_IMPL_NAME_RE = re.compile(rb'(?:[^\n]*[^\S\n]for[^\S\n]+)?((?:\w|[\x80-\xff])+)')
+
+# Declaration keyword pattern -> (API type, pattern extracting the name after it)
+_DECLARATION_KINDS = {
+    rb'(?:async[^\S\n]+)?fn': ('function', _RUST_NAME_RE),
+    rb'struct': ('struct', _RUST_NAME_RE),
+    rb'enum': ('enum', _RUST_NAME_RE),
+    rb'trait': ('trait', _RUST_NAME_RE),
+    rb'impl': ('impl', _RUST_IMPL_NAME_RE),
+    rb'const': ('const', _RUST_NAME_RE),
+    rb'static': ('static', _RUST_NAME_RE),
+}
+
+# `pub` followed by a declaration keyword; the name is read separately.
+# Patterns are bytes because files are scanned without decoding, and
+# whitespace is [^\S\n] so a match never spans lines. Starting with a
+# literal lets the regex engine jump straight to each `pub` in a file.
+# Each keyword is its own numbered group, so match.lastindex picks the
+# declaration kind by tuple index instead of a dict lookup.
+_RUST_PUB_RE = re.compile(
+    rb'pub[^\S\n]+(?:(' + rb')|('.join(_DECLARATION_KINDS) + rb'))[^\S\n]+'
+)
+_KIND_BY_GROUP = (None, *_DECLARATION_KINDS.values())
+
+
+def _doc_comment_above(source: mmap.mmap, line_start: int) -> Optional[str]:
+    """Collect the doc comment lines directly above the line at line_start."""
     doc_lines = []
-    i = target_line - 2  # 0-indexed, look at line before
-
-    # Walk backwards collecting doc comment lines
-    while i >= 0:
-        line = lines[i].strip()
-        if line.startswith('///'):
-            doc_lines.insert(0, line[3:].strip())
-            i -= 1
-        elif line.startswith('//!'):
-            # Module-level docs
-            doc_lines.insert(0, line[3:].strip())
-            i -= 1
-        elif not line:
-            # Empty line breaks the doc comment chain
-            break
-        else:
+    line_end = line_start - 1  # Newline ending the previous line
+
+    # Walk backwards; empty lines and any other content end the comment
+    while line_end >= 0:
+        prev_start = source.rfind(b'\n', 0, line_end) + 1
+        line = source[prev_start:line_end].strip()
+        # '//!' is module-level docs, collected the same way as '///'
+        if not line.startswith((b'///', b'//!')):
             break
+        doc_lines.append(line[3:].strip())
+        line_end = prev_start - 1
 
-    if doc_lines:
-        return True, '\n'.join(doc_lines)
-    return False, None
+    if not doc_lines:
+        return None
+    return b'\n'.join(reversed(doc_lines)).decode('utf-8', 'replace')
 
 
 def parse_rust_file(file_path: Path) -> List[PublicAPI]:
-    """Parse a Rust file and extract public API elements."""
+    """Parse a Rust file and extract public API elements.
+
+    The file is memory-mapped and searched as bytes by the regex engine,
+    so lines without a `pub` declaration are never visited from Python.
+    Only matched declarations and their doc comments are decoded.
+    """
     apis = []
 
     try:
-        content = file_path.read_text(encoding='utf-8')
-        lines = content.split('\n')
+        with open(file_path, 'rb') as f:
+            source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     except Exception:
+        # Unreadable, or empty (an empty file cannot be mapped)
         return apis
 
-    # Patterns for Rust declarations
-    pub_func_pattern = re.compile(r'^\s*pub\s+(?:async\s+)?fn\s+(\w+)')
-    pub_struct_pattern = re.compile(r'^\s*pub\s+struct\s+(\w+)')
-    pub_enum_pattern = re.compile(r'^\s*pub\s+enum\s+(\w+)')
-    pub_trait_pattern = re.compile(r'^\s*pub\s+trait\s+(\w+)')
-    pub_impl_pattern = re.compile(r'^\s*pub\s+impl\s+(?:.*\s+for\s+)?(\w+)')
-    pub_const_pattern = re.compile(r'^\s*pub\s+const\s+(\w+)')
-    pub_static_pattern = re.compile(r'^\s*pub\s+static\s+(\w+)')
-
-    for i, line in enumerate(lines, 1):
-        stripped = line.strip()
-
-        # Check for public function
-        match = pub_func_pattern.match(stripped)
-        if match:
-            name = match.group(1)
-            has_doc, doc_comment = extract_doc_comment(lines, i)
-            apis.append(PublicAPI(
-                file_path=str(file_path),
-                line_number=i,
-                api_type='function',
-                name=name,
-                signature=stripped[:100],  # First 100 chars
-                has_doc=has_doc,
-                doc_comment=doc_comment
-            ))
-            continue
+    with source:
+        line_number = 1
+        counted_to = 0  # Offset up to which newlines are counted
 
-        # Check for public struct
-        match = pub_struct_pattern.match(stripped)
-        if match:
-            name = match.group(1)
-            has_doc, doc_comment = extract_doc_comment(lines, i)
-            apis.append(PublicAPI(
-                file_path=str(file_path),
-                line_number=i,
-                api_type='struct',
-                name=name,
-                signature=stripped[:100],
-                has_doc=has_doc,
-                doc_comment=doc_comment
-            ))
-            continue
+        for match in _RUST_PUB_RE.finditer(source):
+            pub_start = match.start()
+            line_start = source.rfind(b'\n', 0, pub_start) + 1
+            line_end = source.find(b'\n', pub_start)
+            if line_end < 0:
+                line_end = len(source)
 
-        # Check for public enum
-        match = pub_enum_pattern.match(stripped)
-        if match:
-            name = match.group(1)
-            has_doc, doc_comment = extract_doc_comment(lines, i)
-            apis.append(PublicAPI(
-                file_path=str(file_path),
-                line_number=i,
-                api_type='enum',
-                name=name,
-                signature=stripped[:100],
-                has_doc=has_doc,
-                doc_comment=doc_comment
-            ))
-            continue
+            # Copy the line out of the map once; it serves both the
+            # indentation check and the signature
+            line = source[line_start:line_end]
 
-        # Check for public trait
-        match = pub_trait_pattern.match(stripped)
-        if match:
-            name = match.group(1)
-            has_doc, doc_comment = extract_doc_comment(lines, i)
-            apis.append(PublicAPI(
-                file_path=str(file_path),
-                line_number=i,
-                api_type='trait',
-                name=name,
-                signature=stripped[:100],
-                has_doc=has_doc,
-                doc_comment=doc_comment
-            ))
-            continue
+            # Only `pub` at the start of a line declares an item; top-level
+            # items have no indentation to check
+            indent = pub_start - line_start
+            if indent and line[:indent].strip():
+                continue
 
-        # Check for public const
-        match = pub_const_pattern.match(stripped)
-        if match:
-            name = match.group(1)
-            has_doc, doc_comment = extract_doc_comment(lines, i)
-            apis.append(PublicAPI(
-                file_path=str(file_path),
-                line_number=i,
-                api_type='const',
-                name=name,
-                signature=stripped[:100],
-                has_doc=has_doc,
-                doc_comment=doc_comment
-            ))
-            continue
+            api_type, name_pattern = _KIND_BY_GROUP[match.lastindex]
+            name_match = name_pattern.match(line, match.end() - line_start)
+            if not name_match:
+                continue
+
+            line_number += source[counted_to:line_start].count(b'\n')
+            counted_to = line_start
+            doc_comment = _doc_comment_above(source, line_start)
 
-        # Check for public static
-        match = pub_static_pattern.match(stripped)
-        if match:
-            name = match.group(1)
-            has_doc, doc_comment = extract_doc_comment(lines, i)
             apis.append(PublicAPI(
                 file_path=str(file_path),
-                line_number=i,
-                api_type='static',
-                name=name,
-                signature=stripped[:100],
-                has_doc=has_doc,
+                line_number=line_number,
+                api_type=api_type,
+                name=name_match.group(1).decode('utf-8', 'replace'),
+                # Indentation is known to be whitespace, so only trailing
+                # whitespace needs stripping
+                signature=line[indent:].rstrip().decode('utf-8', 'replace')[:100],  # First 100 chars
+                has_doc=doc_comment is not None,
                 doc_comment=doc_comment
             ))
-            continue
 
     return apis
 
 
-def scan_directory(path: Path) -> List[PublicAPI]:
-    """Scan a directory for Rust files and extract public APIs."""
+def scan_directory(path: Path, jobs: Optional[int] = None) -> List[PublicAPI]:
+    """Scan a directory for Rust files and extract public APIs.
+
+    Files are parsed in a process pool of ``jobs`` workers (default: CPU
+    count). Small trees, or ``jobs == 1``, are parsed serially.
+    """
     all_apis = []
 
-    for rust_file in path.rglob('*.rs'):
-        # Skip test files and examples
-        if 'test' in rust_file.parts or 'example' in rust_file.parts:
-            continue
-        apis = parse_rust_file(rust_file)
-        all_apis.extend(apis)
+    # Skip test files and examples
+    rust_files = [
+        rust_file for rust_file in path.rglob('*.rs')
+        if 'test' not in rust_file.parts and 'example' not in rust_file.parts
+    ]
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(rust_files) <= PARALLEL_MIN_FILES:
+        for rust_file in rust_files:
+            all_apis.extend(parse_rust_file(rust_file))
+        return all_apis
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for apis in executor.map(parse_rust_file, rust_files, chunksize=32):
+            all_apis.extend(apis)
 
     return all_apis
 
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Check that public Rust APIs are documented"
@@ -220,6 +203,8 @@ def main():
                         help="Fail if any undocumented APIs found")
     parser.add_argument('--threshold', type=int, default=0,
                         help="Minimum documentation coverage percentage")
+    parser.add_argument('--jobs', '-j', type=positive_int, default=os.cpu_count(),
+                        help="Number of worker processes (default: CPU count, 1 = serial)")
 
     args = parser.parse_args()
 
@@ -235,7 +220,7 @@ def main():
     print(f"Scanning for public APIs in: {target_path}")
     print("")
 
-    apis = scan_directory(target_path)
+    apis = scan_directory(target_path, args.jobs)
 
     if not apis:
         print("No public APIs found.")
@@ -12,91 +12,205 @@ for LLMs and AI agents. Two variants are generated:
 """
 
 import argparse
+import hashlib
+import io
+import json
+import os
 import re
 import sys
+import time
 from pathlib import Path
-from typing import NamedTuple
+from typing import Iterator, NamedTuple
+
+# Parsed markdown is cached by content hash in the user's own cache
+# directory; entries expire after a day
+DEFAULT_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'morphir-llms'
+CACHE_TTL_SECONDS = 24 * 60 * 60
+# Cache keys are salted with this script's source, so editing the parser
+# invalidates entries written by the previous version
+_CACHE_SALT = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).digest()
+
+_LINK_DEF_RE = re.compile(r'^\[[^\]]+\]:\s')
 
 
 class DocPage(NamedTuple):
-    """Represents a documentation page."""
+    """Represents a documentation page.
+
+    Page content is not held in memory; load_content reads it on demand.
+    """
     title: str
     path: Path
     description: str
     nav_order: int
     parent: str | None
-    content: str
 
+    def load_content(self, docs_dir: Path) -> str | None:
+        """Read the page's markdown content without frontmatter.
+
+        Returns None, with a warning, if the file can no longer be read.
+        """
+        path = docs_dir / self.path
+        try:
+            content = path.read_text(encoding='utf-8')
+        except Exception as e:
+            print(f"Warning: Could not read {path}: {e}", file=sys.stderr)
+            return None
+        return markdown_body(content)
+
+
+def _iter_lines(text: str, pos: int = 0) -> Iterator[tuple[str, int]]:
+    """Lazily yield (line, end) pairs from pos, like text[pos:].split('\\n').
+
+    end is the offset just past the line's newline, where the next line starts.
+    """
+    while True:
+        end = text.find('\n', pos)
+        if end < 0:
+            yield text[pos:], len(text)
+            return
+        yield text[pos:end], end + 1
+        pos = end + 1
+
+
+def _strip_html_comments(line: str, in_comment: bool) -> tuple[str, bool]:
+    """Remove HTML comments from a line, carrying open comments across lines."""
+    if in_comment:
+        end = line.find('-->')
+        if end < 0:
+            return '', True
+        line = line[end + 3:]
+
+    while '<!--' in line:
+        start = line.find('<!--')
+        end = line.find('-->', start + 4)
+        if end < 0:
+            return line[:start], True
+        line = line[:start] + line[end + 3:]
+
+    return line, False
+
+
+def _parse_frontmatter(content: str) -> tuple[dict, int]:
+    """Parse frontmatter into (frontmatter, offset where the body starts)."""
+    frontmatter = {}
 
-def extract_frontmatter(content: str) -> dict:
-    """Extract YAML frontmatter from markdown content."""
-    if not content.startswith('---'):
-        return {}
+    # Frontmatter is delimited by '---' lines at the top of the file
+    lines = _iter_lines(content)
+    first_line, _ = next(lines)
+    if first_line.rstrip() == '---':
+        for line, end in lines:
+            if line.rstrip() == '---':
+                return frontmatter, end
+            if ':' in line:
+                key, value = line.split(':', 1)
+                frontmatter[key.strip()] = value.strip().strip('"\'')
 
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        return {}
+    # No frontmatter, or an unterminated block: the whole file is body
+    return {}, 0
 
-    frontmatter = {}
-    for line in parts[1].strip().split('\n'):
-        if ':' in line:
-            key, value = line.split(':', 1)
-            frontmatter[key.strip()] = value.strip().strip('"\'')
 
-    return frontmatter
+def markdown_body(content: str) -> str:
+    """Return the markdown content without frontmatter."""
+    _, body_start = _parse_frontmatter(content)
+    return content[body_start:].strip()
 
 
-def extract_description(content: str) -> str:
-    """Extract first paragraph as description."""
-    # Remove frontmatter
-    if content.startswith('---'):
-        parts = content.split('---', 2)
-        if len(parts) >= 3:
-            content = parts[2]
+def parse_markdown(content: str) -> tuple[dict, str]:
+    """Parse markdown into (frontmatter, description).
 
-    # Remove HTML comments
-    content = re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
+    The description is the first paragraph after the frontmatter, skipping
+    headings, code blocks, Jekyll attributes, link definitions and HTML
+    comments.
+    """
+    frontmatter, body_start = _parse_frontmatter(content)
 
-    # Find first non-empty paragraph after headings
-    lines = content.strip().split('\n')
     paragraph_lines = []
     in_code_block = False
+    in_comment = False
+    pending = ''
+
+    for line, _ in _iter_lines(content, body_start):
+        # Text around a comment spanning lines is joined into one line
+        was_in_comment = in_comment
+        text, in_comment = _strip_html_comments(line, in_comment)
+        if was_in_comment:
+            text = pending + text
+        if in_comment:
+            pending = text
+            continue
 
-    for line in lines:
-        if line.strip().startswith('```'):
-            in_code_block = not in_code_block
+        stripped = text.strip()
+        if not stripped:
+            if paragraph_lines and not in_code_block:
+                break
             continue
-        if in_code_block:
+
+        # Dispatch on the first character before any string method call
+        first = stripped[0]
+        if first == '`' and stripped.startswith('```'):
+            in_code_block = not in_code_block
             continue
-        if line.strip().startswith('#'):
+        if in_code_block or first == '#':
             continue
-        if line.strip().startswith('{:'):  # Jekyll attributes
+        if first == '{' and stripped.startswith('{:'):  # Jekyll attributes
             continue
-        if line.strip().startswith('[') and ']: ' in line:  # Link definitions
+        if first == '[' and _LINK_DEF_RE.match(stripped):  # Link definitions
             continue
-        if line.strip():
-            paragraph_lines.append(line.strip())
-        elif paragraph_lines:
-            break
+        paragraph_lines.append(stripped)
 
     description = ' '.join(paragraph_lines)
     # Truncate to reasonable length
     if len(description) > 200:
         description = description[:197] + '...'
 
-    return description
+    return frontmatter, description
+
+
+def parse_markdown_cached(content: str, cache_dir: Path | None) -> tuple[dict, str]:
+    """Return parse_markdown's (frontmatter, description), cached by content.
+
+    The body is not cached; pages load it on demand with DocPage.load_content.
+    """
+    if cache_dir is None:
+        return parse_markdown(content)
+
+    key = hashlib.blake2b(content.encode('utf-8'), digest_size=16, key=_CACHE_SALT).hexdigest()
+    entry = cache_dir / f"{key}.json"
+
+    try:
+        if time.time() - entry.stat().st_mtime < CACHE_TTL_SECONDS:
+            cached = json.loads(entry.read_text(encoding='utf-8'))
+            return cached['frontmatter'], cached['description']
+    except (OSError, ValueError, KeyError):
+        pass  # Missing, expired or unreadable entry: parse again
+
+    frontmatter, description = parse_markdown(content)
+
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        entry.write_text(json.dumps({
+            'frontmatter': frontmatter,
+            'description': description,
+        }), encoding='utf-8')
+    except OSError as e:
+        print(f"Warning: Could not write cache entry {entry}: {e}", file=sys.stderr)
+
+    return frontmatter, description
 
 
-def get_content_without_frontmatter(content: str) -> str:
-    """Get markdown content without frontmatter."""
-    if content.startswith('---'):
-        parts = content.split('---', 2)
-        if len(parts) >= 3:
-            return parts[2].strip()
-    return content.strip()
+def prune_cache(cache_dir: Path) -> None:
+    """Delete cache entries older than CACHE_TTL_SECONDS."""
+    cutoff = time.time() - CACHE_TTL_SECONDS
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+    except OSError as e:
+        print(f"Warning: Could not prune cache {cache_dir}: {e}", file=sys.stderr)
 
 
-def parse_doc_file(path: Path, docs_dir: Path) -> DocPage | None:
+def parse_doc_file(path: Path, docs_dir: Path, cache_dir: Path | None = None) -> DocPage | None:
     """Parse a markdown documentation file."""
     try:
         content = path.read_text(encoding='utf-8')
@@ -104,7 +218,7 @@ def parse_doc_file(path: Path, docs_dir: Path) -> DocPage | None:
         print(f"Warning: Could not read {path}: {e}", file=sys.stderr)
         return None
 
-    frontmatter = extract_frontmatter(content)
+    frontmatter, description = parse_markdown_cached(content, cache_dir)
 
     # Skip files without frontmatter (not part of navigation)
     if not frontmatter:
@@ -118,21 +232,21 @@ def parse_doc_file(path: Path, docs_dir: Path) -> DocPage | None:
     nav_order = int(frontmatter.get('nav_order', 999))
     parent = frontmatter.get('parent')
 
-    description = extract_description(content)
-    clean_content = get_content_without_frontmatter(content)
-
     return DocPage(
         title=title,
         path=path.relative_to(docs_dir),
         description=description,
         nav_order=nav_order,
         parent=parent,
-        content=clean_content,
     )
 
 
-def collect_docs(docs_dir: Path) -> list[DocPage]:
-    """Collect all documentation pages."""
+def collect_docs(docs_dir: Path, cache_dir: Path | None = None) -> list[DocPage]:
+    """Collect all documentation pages.
+
+    If cache_dir is given, parsed markdown is cached there by content hash,
+    and expired entries are deleted once the pages are collected.
+    """
     docs = []
 
     for md_file in docs_dir.rglob('*.md'):
@@ -142,10 +256,13 @@ def collect_docs(docs_dir: Path) -> list[DocPage]:
         if 'man' in md_file.parts:
             continue
 
-        doc = parse_doc_file(md_file, docs_dir)
+        doc = parse_doc_file(md_file, docs_dir, cache_dir)
         if doc:
             docs.append(doc)
 
+    if cache_dir is not None:
+        prune_cache(cache_dir)
+
     return docs
 
 
@@ -159,22 +276,23 @@ def organize_docs(docs: list[DocPage]) -> dict[str, list[DocPage]]:
         'Other': [],
     }
 
+    # Parent lookup by title; the first page with a given title wins
+    title_index = {d.title: d for d in reversed(docs)}
+
     for doc in docs:
         if doc.parent:
             if doc.parent in sections:
                 sections[doc.parent].append(doc)
-            elif any(doc.parent == d.title for d in docs):
+            else:
                 # Find the grandparent
-                parent_doc = next((d for d in docs if d.title == doc.parent), None)
-                if parent_doc and parent_doc.parent and parent_doc.parent in sections:
+                parent_doc = title_index.get(doc.parent)
+                if parent_doc and parent_doc.parent in sections:
                     sections[parent_doc.parent].append(doc)
                 else:
                     sections['Other'].append(doc)
-            else:
-                sections['Other'].append(doc)
         elif doc.title in sections:
-            # This is a section index page, add to that section
-            sections[doc.title].insert(0, doc)
+            # This is a section index page, add to that section (sorted below)
+            sections[doc.title].append(doc)
         elif doc.title == 'Home':
             continue  # Skip home page, will be in header
         else:
@@ -191,18 +309,19 @@ def generate_llms_txt(docs: list[DocPage], base_url: str) -> str:
     """Generate compact llms.txt content."""
     sections = organize_docs(docs)
 
-    lines = [
-        "# Morphir Rust",
-        "",
+    # Blocks after the header start with their blank separator line
+    buf = io.StringIO()
+    buf.write(
+        "# Morphir Rust\n"
+        "\n"
         "> Rust-based CLI tools and libraries for the Morphir ecosystem. "
         "Morphir enables functional domain modeling where you write business logic once "
-        "and consume it through visualizations, code generation, type checking, and execution.",
-        "",
+        "and consume it through visualizations, code generation, type checking, and execution.\n"
+        "\n"
         "Morphir Rust provides tools for working with Morphir IR (Intermediate Representation), "
         "including format migration, validation, and code generation. It supports language bindings "
-        "for Gleam and includes an extension system for adding new languages and targets.",
-        "",
-    ]
+        "for Gleam and includes an extension system for adding new languages and targets.\n"
+    )
 
     # Add sections
     section_order = ['Getting Started', 'CLI Reference', 'Tutorials', 'For Contributors']
@@ -212,52 +331,51 @@ def generate_llms_txt(docs: list[DocPage], base_url: str) -> str:
         if not section_docs:
             continue
 
-        lines.append(f"## {section_name}")
-        lines.append("")
+        buf.write(f"\n## {section_name}\n\n")
 
         for doc in section_docs:
             url = f"{base_url}/{doc.path}".replace('.md', '').replace('/index', '/')
             if doc.description:
-                lines.append(f"- [{doc.title}]({url}): {doc.description}")
+                buf.write(f"- [{doc.title}]({url}): {doc.description}\n")
             else:
-                lines.append(f"- [{doc.title}]({url})")
-
-        lines.append("")
+                buf.write(f"- [{doc.title}]({url})\n")
 
     # Add optional section for less critical docs
     other_docs = sections.get('Other', [])
     if other_docs:
-        lines.append("## Optional")
-        lines.append("")
+        buf.write("\n## Optional\n\n")
         for doc in other_docs:
             url = f"{base_url}/{doc.path}".replace('.md', '').replace('/index', '/')
             if doc.description:
-                lines.append(f"- [{doc.title}]({url}): {doc.description}")
+                buf.write(f"- [{doc.title}]({url}): {doc.description}\n")
             else:
-                lines.append(f"- [{doc.title}]({url})")
-        lines.append("")
+                buf.write(f"- [{doc.title}]({url})\n")
+
+    return buf.getvalue()
 
-    return '\n'.join(lines)
 
+def generate_llms_full_txt(docs: list[DocPage], base_url: str, docs_dir: Path) -> str:
+    """Generate full llms-full.txt with complete content.
 
-def generate_llms_full_txt(docs: list[DocPage], base_url: str) -> str:
-    """Generate full llms-full.txt with complete content."""
+    Page content is read from docs_dir one page at a time.
+    """
     sections = organize_docs(docs)
 
-    lines = [
-        "# Morphir Rust",
-        "",
+    # Blocks after the header start with their blank separator line
+    buf = io.StringIO()
+    buf.write(
+        "# Morphir Rust\n"
+        "\n"
         "> Rust-based CLI tools and libraries for the Morphir ecosystem. "
         "Morphir enables functional domain modeling where you write business logic once "
-        "and consume it through visualizations, code generation, type checking, and execution.",
-        "",
+        "and consume it through visualizations, code generation, type checking, and execution.\n"
+        "\n"
         "Morphir Rust provides tools for working with Morphir IR (Intermediate Representation), "
         "including format migration, validation, and code generation. It supports language bindings "
-        "for Gleam and includes an extension system for adding new languages and targets.",
-        "",
-        "---",
-        "",
-    ]
+        "for Gleam and includes an extension system for adding new languages and targets.\n"
+        "\n"
+        "---\n"
+    )
 
     # Add all content organized by section
     section_order = ['Getting Started', 'CLI Reference', 'Tutorials', 'For Contributors', 'Other']
@@ -267,20 +385,18 @@ def generate_llms_full_txt(docs: list[DocPage], base_url: str) -> str:
         if not section_docs:
             continue
 
-        lines.append(f"# {section_name}")
-        lines.append("")
+        buf.write(f"\n# {section_name}\n")
 
         for doc in section_docs:
             url = f"{base_url}/{doc.path}".replace('.md', '').replace('/index', '/')
-            lines.append(f"## {doc.title}")
-            lines.append(f"Source: {url}")
-            lines.append("")
-            lines.append(doc.content)
-            lines.append("")
-            lines.append("---")
-            lines.append("")
+            content = doc.load_content(docs_dir)
+            if content is None:
+                continue
+            buf.write(f"\n## {doc.title}\nSource: {url}\n\n")
+            buf.write(content)
+            buf.write("\n\n---\n")
 
-    return '\n'.join(lines)
+    return buf.getvalue()
 
 
 def main():
@@ -314,6 +430,17 @@ def main():
         action='store_true',
         help='Generate only llms-full.txt',
     )
+    parser.add_argument(
+        '--cache-dir',
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f'Directory for cached parse results (default: {DEFAULT_CACHE_DIR})',
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Parse every file from scratch without reading or writing the cache',
+    )
 
     args = parser.parse_args()
 
@@ -325,7 +452,7 @@ def main():
 
     # Collect documentation
     print(f"Scanning {args.docs_dir} for documentation...")
-    docs = collect_docs(args.docs_dir)
+    docs = collect_docs(args.docs_dir, None if args.no_cache else args.cache_dir)
     print(f"Found {len(docs)} documentation pages")
 
     # Generate llms.txt (compact)
@@ -337,7 +464,7 @@ def main():
 
     # Generate llms-full.txt
     if not args.compact_only:
-        llms_full_txt = generate_llms_full_txt(docs, args.base_url)
+        llms_full_txt = generate_llms_full_txt(docs, args.base_url, args.docs_dir)
         output_path = args.output_dir / 'llms-full.txt'
         output_path.write_text(llms_full_txt, encoding='utf-8')
         print(f"Generated {output_path} ({len(llms_full_txt)} bytes)")
@@ -6,11 +6,13 @@ This script validates that documentation follows the expected structure,
 has proper Jekyll frontmatter, and files are in the correct sections.
 
 Usage:
-    python validate_docs_structure.py [--fix] [--verbose] [path]
+    python validate_docs_structure.py [--fix] [--verbose] [--jobs N] [--no-cache] [path]
 
 Options:
     --fix      Attempt to fix common issues (add missing frontmatter)
     --verbose  Show detailed output
+    --jobs N   Number of worker processes (default: CPU count, 1 = serial)
+    --no-cache Validate every file without reading or writing the results cache
     path       Specific file or directory to check (default: docs/)
 
 Exit codes:
@@ -20,12 +22,41 @@ Exit codes:
 """
 
 import argparse
+import hashlib
+import json
 import os
 import re
 import sys
-import yaml
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from importlib.machinery import PathFinder
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple, Optional
+
+# Below this many files, forking worker processes costs more than it saves
+PARALLEL_MIN_FILES = 16
+
+
+def _has_libyaml() -> bool:
+    """Tell whether PyYAML was built with libyaml, without importing it."""
+    spec = find_spec('yaml')
+    if spec is None or spec.submodule_search_locations is None:
+        return False
+    return PathFinder.find_spec('_yaml', spec.submodule_search_locations) is not None
+
+
+# Results cache, kept in the project root
+CACHE_FILE_NAME = '.validate_docs_cache.json'
+# The cache is salted with this script's source, so editing the validators
+# invalidates results written by the previous version, and with whether
+# libyaml is available: CSafeLoader and SafeLoader disagree on some
+# frontmatter (libyaml accepts a tab after 'key:', for one).
+_CACHE_SALT = '{}:{}'.format(
+    hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest(),
+    'libyaml' if _has_libyaml() else 'pure',
+)
 
 # Expected documentation sections and their purposes
 EXPECTED_SECTIONS = {
@@ -47,18 +78,96 @@ EXPECTED_SECTIONS = {
     },
 }
 
-
-class ValidationError:
+# Patterns applied to every file (and, for headings, every line)
+_FM_RE = re.compile(r'^---\n(.*?)\n---\n?(.*)$', re.DOTALL)
+_H1_RE = re.compile(r'\s*#\s+\S')
+# Whitespace other than a newline, so the match stays on one line
+_HEADING_RE = re.compile(r'^(#{1,6})[^\S\n]+\S', re.MULTILINE)
+_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+
+# (path, size, mtime_ns) of a file to validate; size and mtime_ns are None
+# if it could not be stat'ed
+FileInfo = Tuple[str, Optional[int], Optional[int]]
+
+# Frontmatter made only of `key: value` lines whose values YAML reads as
+# plain strings or decimal integers; these are parsed without YAML
+_SIMPLE_FM_RE = re.compile(
+    r'(?:[A-Za-z_][\w-]*: +(?:[A-Za-z][\w .,()/-]*|0|[1-9][0-9]*) *(?:\n|$))+'
+)
+_SIMPLE_FM_LINE_RE = re.compile(r'^([A-Za-z_][\w-]*): +(.+?) *$', re.MULTILINE)
+# Plain scalars that YAML 1.1 resolves to booleans or null, not strings
+_YAML_SPECIAL_WORDS = frozenset(
+    'yes Yes YES no No NO true True TRUE false False FALSE '
+    'on On ON off Off OFF null Null NULL'.split()
+)
+
+# PyYAML module and loader, set by _import_yaml
+_yaml = None
+_YamlLoader = None
+
+# Content of files fix_missing_frontmatter can fix, kept so --fix does not
+# read them again. Only filled when validating with keep_content, which
+# validate_files does only for files it validates in this process.
+_content_cache: Dict[str, str] = {}
+
+
+class ValidationError(NamedTuple):
     """Represents a validation error."""
-    def __init__(self, file_path: str, error_type: str, message: str, fixable: bool = False):
-        self.file_path = file_path
-        self.error_type = error_type
-        self.message = message
-        self.fixable = fixable
-
-    def __str__(self):
-        fix_indicator = " [FIXABLE]" if self.fixable else ""
-        return f"{self.error_type}: {self.file_path}\n  {self.message}{fix_indicator}"
+    file_path: str
+    error_type: str
+    message: str
+    fixable: bool = False
+
+
+def format_error(error: ValidationError) -> str:
+    """Format a validation error for display."""
+    fix_indicator = " [FIXABLE]" if error.fixable else ""
+    return f"{error.error_type}: {error.file_path}\n  {error.message}{fix_indicator}"
+
+
+def parse_simple_frontmatter(text: str) -> Optional[Dict]:
+    """Parse frontmatter of plain `key: value` lines without YAML.
+
+    Returns None if the text needs a real YAML parser.
+    """
+    if not _SIMPLE_FM_RE.fullmatch(text):
+        return None
+
+    frontmatter = {}
+    for key, value in _SIMPLE_FM_LINE_RE.findall(text):
+        if key in _YAML_SPECIAL_WORDS or value in _YAML_SPECIAL_WORDS:
+            return None
+        frontmatter[key] = int(value) if value.isdigit() else value
+    return frontmatter
+
+
+def _import_yaml():
+    """Import PyYAML and pick its loader on first use.
+
+    Most frontmatter is handled by parse_simple_frontmatter, so runs that
+    never need YAML (and --help) skip the import entirely.
+    """
+    global _yaml, _YamlLoader
+    if _yaml is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader as loader
+        _yaml, _YamlLoader = yaml, loader
+    return _yaml
+
+
+def load_frontmatter(text: str):
+    """Load frontmatter text, raising ValueError if it is invalid YAML."""
+    frontmatter = parse_simple_frontmatter(text)
+    if frontmatter is None:
+        yaml = _import_yaml()
+        try:
+            frontmatter = yaml.load(text, Loader=_YamlLoader)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML frontmatter: {e}") from e
+    return frontmatter
 
 
 def extract_frontmatter(content: str) -> Tuple[Optional[Dict], str]:
@@ -66,75 +175,65 @@ def extract_frontmatter(content: str) -> Tuple[Optional[Dict], str]:
     if not content.startswith('---'):
         return None, content
 
-    match = re.match(r'^---\n(.*?)\n---\n?(.*)$', content, re.DOTALL)
+    match = _FM_RE.match(content)
     if not match:
         return None, content
 
     try:
-        frontmatter = yaml.safe_load(match.group(1))
-        body = match.group(2)
-        return frontmatter, body
-    except yaml.YAMLError:
+        return load_frontmatter(match.group(1)), match.group(2)
+    except ValueError:
         return None, content
 
 
-def validate_frontmatter(file_path: Path, content: str) -> List[ValidationError]:
-    """Validate markdown file Jekyll frontmatter."""
-    errors = []
-    frontmatter, body = extract_frontmatter(content)
+def validate_frontmatter(file_path: str, frontmatter: Dict,
+                         has_title_heading: bool) -> Iterator[ValidationError]:
+    """Validate markdown file Jekyll frontmatter.
 
-    if frontmatter is None:
-        errors.append(ValidationError(
-            str(file_path),
-            "MISSING_FRONTMATTER",
-            "File is missing YAML frontmatter (---)",
-            fixable=True
-        ))
-        return errors
+    has_title_heading tells whether the body starts with an H1 heading,
+    which can stand in for a frontmatter title.
+    """
+    if not isinstance(frontmatter, dict):
+        frontmatter = {}  # A YAML list or scalar has no fields
 
     # Check for required Jekyll fields
     if 'layout' not in frontmatter:
-        errors.append(ValidationError(
+        yield ValidationError(
             str(file_path),
             "MISSING_LAYOUT",
             "Frontmatter missing 'layout: default' field (required for Jekyll)",
             fixable=True
-        ))
-    elif frontmatter.get('layout') != 'default':
-        errors.append(ValidationError(
+        )
+    elif frontmatter['layout'] != 'default':
+        yield ValidationError(
             str(file_path),
             "INVALID_LAYOUT",
-            f"Layout should be 'default' for just-the-docs theme, found: {frontmatter.get('layout')}",
+            f"Layout should be 'default' for just-the-docs theme, found: {frontmatter['layout']}",
             fixable=True
-        ))
+        )
 
-    # Title is required
-    if 'title' not in frontmatter:
-        # Check for h1 heading in body as fallback
-        if not re.match(r'^#\s+\S', body.strip()):
-            errors.append(ValidationError(
-                str(file_path),
-                "MISSING_TITLE",
-                "File needs 'title' in frontmatter or an H1 heading",
-                fixable=False
-            ))
+    # Title is required, with an H1 heading in the body as fallback
+    if 'title' not in frontmatter and not has_title_heading:
+        yield ValidationError(
+            str(file_path),
+            "MISSING_TITLE",
+            "File needs 'title' in frontmatter or an H1 heading",
+            fixable=False
+        )
 
     # nav_order is recommended but not required
     if 'nav_order' not in frontmatter:
-        errors.append(ValidationError(
+        yield ValidationError(
             str(file_path),
             "MISSING_NAV_ORDER",
             "Frontmatter missing 'nav_order' field (recommended for navigation ordering)",
             fixable=True
-        ))
-
-    return errors
+        )
 
 
-def validate_file_location(file_path: Path, docs_root: Path) -> List[ValidationError]:
+def validate_file_location(file_path: str, docs_root: Path) -> List[ValidationError]:
     """Validate that files are in appropriate sections."""
     errors = []
-    relative_path = file_path.relative_to(docs_root)
+    relative_path = Path(file_path).relative_to(docs_root)
     parts = relative_path.parts
 
     if len(parts) < 2:
@@ -151,77 +250,246 @@ def validate_file_location(file_path: Path, docs_root: Path) -> List[ValidationE
     return errors
 
 
-def validate_heading_structure(file_path: Path, content: str) -> List[ValidationError]:
-    """Validate heading hierarchy in markdown."""
-    errors = []
-    _, body = extract_frontmatter(content)
+def heading_levels(body: str) -> Iterator[int]:
+    """Yield the level of each markdown heading in body."""
+    for match in _HEADING_RE.finditer(body):
+        yield len(match.group(1))
+
 
-    lines = body.split('\n')
+def validate_heading_structure(file_path: str, levels: Iterable[int]) -> Iterator[ValidationError]:
+    """Validate heading hierarchy in markdown, given its heading levels."""
     prev_level = 0
     h1_count = 0
 
-    for line in lines:
-        match = re.match(r'^(#{1,6})\s+\S', line)
-        if match:
-            level = len(match.group(1))
+    for level in levels:
+        if level == 1:
+            h1_count += 1
 
-            if level == 1:
-                h1_count += 1
-
-            # Check for heading level jumps (e.g., h1 -> h3)
-            if prev_level > 0 and level > prev_level + 1:
-                errors.append(ValidationError(
-                    str(file_path),
-                    "HEADING_SKIP",
-                    f"Heading level jumps from H{prev_level} to H{level}",
-                    fixable=False
-                ))
+        # Check for heading level jumps (e.g., h1 -> h3)
+        if prev_level > 0 and level > prev_level + 1:
+            yield ValidationError(
+                str(file_path),
+                "HEADING_SKIP",
+                f"Heading level jumps from H{prev_level} to H{level}",
+                fixable=False
+            )
 
-            prev_level = level
+        prev_level = level
 
     # Multiple H1 headings (usually one from title, one in body is OK)
     if h1_count > 2:
-        errors.append(ValidationError(
+        yield ValidationError(
             str(file_path),
             "MULTIPLE_H1",
             f"File has {h1_count} H1 headings (should have at most 2: title + one in body)",
             fixable=False
-        ))
+        )
 
-    return errors
 
+def validate_document(file_path: str, docs_root: Path, frontmatter: Optional[Dict],
+                      has_title_heading: bool, levels: Iterable[int]) -> Iterator[ValidationError]:
+    """Run all validations on a file's parsed frontmatter and heading levels.
 
-def validate_file(file_path: Path, docs_root: Path, verbose: bool = False) -> List[ValidationError]:
-    """Run all validations on a single file."""
-    errors = []
+    Files without (valid) frontmatter are reported as such and their
+    headings are not checked: they are usually not Jekyll pages, and their
+    heading layout is often intentional.
+    """
+    if frontmatter is None:
+        yield ValidationError(
+            str(file_path),
+            "MISSING_FRONTMATTER",
+            "File is missing YAML frontmatter (---)",
+            fixable=True
+        )
+    else:
+        yield from validate_frontmatter(file_path, frontmatter, has_title_heading)
+
+    yield from validate_file_location(file_path, docs_root)
+
+    if frontmatter is not None:
+        yield from validate_heading_structure(file_path, levels)
 
+
+def validate_file(file_path: str, docs_root: Path, verbose: bool = False,
+                  keep_content: bool = False) -> Iterator[ValidationError]:
+    """Run all validations on a single file.
+
+    With keep_content, the content of a file fix_missing_frontmatter can fix
+    is kept in _content_cache.
+    """
     try:
-        content = file_path.read_text(encoding='utf-8')
+        with open(file_path, encoding='utf-8') as f:
+            content = f.read()
     except Exception as e:
-        errors.append(ValidationError(
+        yield ValidationError(
             str(file_path),
             "READ_ERROR",
             f"Could not read file: {e}",
             fixable=False
-        ))
-        return errors
+        )
+        return
 
-    errors.extend(validate_frontmatter(file_path, content))
-    errors.extend(validate_file_location(file_path, docs_root))
-    errors.extend(validate_heading_structure(file_path, content))
+    frontmatter, body = extract_frontmatter(content)
+    if keep_content and frontmatter is None and not content.startswith('---'):
+        _content_cache[file_path] = content
+    yield from validate_document(file_path, docs_root, frontmatter,
+                                 bool(_H1_RE.match(body)), heading_levels(body))
+
+
+def _validate_one(info: FileInfo, docs_root: Path, keep_content: bool = False) -> List[ValidationError]:
+    """Validate one file, collecting its errors so a worker process can return them."""
+    return list(validate_file(info[0], docs_root, keep_content=keep_content))
 
-    return errors
+
+def load_cache(cache_file: Path, docs_root: Path) -> Dict[str, list]:
+    """Load cached results as {file_path: [size, mtime_ns, errors]}.
+
+    Returns an empty cache if the file is missing or unreadable, or was
+    written by another version of this script, with another YAML loader or
+    for another docs root.
+    """
+    try:
+        with open(cache_file, encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache['salt'] == _CACHE_SALT and cache['docs_root'] == str(docs_root):
+            return cache['files']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return {}
+
+
+def save_cache(cache_file: Path, docs_root: Path, entries: Dict[str, list]) -> None:
+    """Write cached results, dropping entries for files that no longer exist.
+
+    The cache is written to a temporary file and moved into place, so an
+    interrupted or concurrent run never leaves a truncated cache behind.
+    """
+    entries = {path: entry for path, entry in entries.items() if os.path.exists(path)}
+    tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'salt': _CACHE_SALT, 'docs_root': str(docs_root), 'files': entries}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Caching is best effort
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+
+
+def _iter_errors(files: List[FileInfo], docs_root: Path, jobs: int,
+                 keep_content: bool = False) -> Iterator[Iterable[ValidationError]]:
+    """Yield each file's errors, in order.
+
+    Files validated serially are yielded as validate_file generators, so
+    each is only read once its errors are iterated. keep_content only
+    applies to those: workers' memory is never seen by this process.
+    """
+    if jobs == 1 or len(files) <= PARALLEL_MIN_FILES:
+        for file_path, _, _ in files:
+            yield validate_file(file_path, docs_root, keep_content=keep_content)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(partial(_validate_one, docs_root=docs_root), files, chunksize=64)
+
+
+def _next_errors(results: Iterator[Iterable[ValidationError]], info: FileInfo,
+                 cache: Optional[Dict[str, list]]) -> Iterator[ValidationError]:
+    """Yield the next file's errors from results, storing them in cache if given."""
+    errors = list(next(results))
+    file_path, size, mtime_ns = info
+    # A file that could not be read may be readable next time
+    if (cache is not None and size is not None
+            and not any(error.error_type == "READ_ERROR" for error in errors)):
+        cache[file_path] = [size, mtime_ns, [error[1:] for error in errors]]
+    yield from errors
+
+
+def validate_files(files: List[FileInfo], docs_root: Path, jobs: Optional[int] = None,
+                   cache: Optional[Dict[str, list]] = None,
+                   keep_content: bool = False) -> Iterator[Tuple[str, Iterator[ValidationError]]]:
+    """Validate files, yielding (file_path, errors) pairs in order.
+
+    Files are validated in a process pool of ``jobs`` workers (default: CPU
+    count). Few files, or ``jobs == 1``, are validated serially; with
+    keep_content, the content of those that --fix can fix is kept for it.
+
+    Each file's errors are only waited for once they are iterated, so a
+    caller can report the file first.
+
+    If a cache from load_cache is given, files whose size and mtime match
+    their entry reuse its errors without being read, and fresh results are
+    stored back into it.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if cache is None:
+        pending = files
+    else:
+        # Unstat'ed files never match, and validate_file reports them
+        pending = [info for info in files
+                   if info[1] is None or cache.get(info[0], [])[:2] != [info[1], info[2]]]
+    results = _iter_errors(pending, docs_root, jobs, keep_content)
+    pending_paths = {info[0] for info in pending}
+    for info in files:
+        file_path = info[0]
+        if file_path in pending_paths:
+            errors = _next_errors(results, info, cache)
+            yield file_path, errors
+            for _ in errors:
+                pass  # Keep results in step if the caller skipped these errors
+        else:
+            yield file_path, iter([ValidationError(file_path, *record) for record in cache[file_path][2]])
+
+
+def file_info(file_path: str, entry: Optional[os.DirEntry] = None) -> FileInfo:
+    """Stat a file once, through its directory entry if there is one.
+
+    The result is the file's results cache key.
+    """
+    try:
+        st = entry.stat() if entry is not None else os.stat(file_path)
+    except OSError:
+        return file_path, None, None
+    return file_path, st.st_size, st.st_mtime_ns
+
+
+def iter_markdown_files(root: str) -> Iterator[FileInfo]:
+    """Recursively yield file_info of markdown files under root.
+
+    Uses os.scandir so no Path objects are made per entry, and each file is
+    stat'ed once, through its directory entry. Like Path.rglob, symlinks
+    named *.md are yielded (a broken one is reported when read) and
+    symlinked directories are not descended into. Files are yielded in the
+    same pre-order as Path.rglob.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith('.md'):
+                    yield file_info(entry.path, entry)
+        stack.extend(reversed(subdirs))
 
 
 def fix_missing_frontmatter(file_path: Path) -> bool:
-    """Add basic Jekyll frontmatter to a file missing it."""
+    """Add basic Jekyll frontmatter to a file missing it.
+
+    The content read during validation is reused when available.
+    """
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = _content_cache.pop(str(file_path), None)
+        if content is None:
+            content = file_path.read_text(encoding='utf-8')
         if content.startswith('---'):
             return False
 
         # Extract title from first heading
-        title_match = re.match(r'^#\s+(.+)$', content.strip(), re.MULTILINE)
+        title_match = _TITLE_RE.match(content.strip())
         title = title_match.group(1) if title_match else file_path.stem.replace('-', ' ').title()
 
         frontmatter = f"""---
@@ -231,13 +499,20 @@ nav_order: 1
 ---
 
 """
-        new_content = frontmatter + content
-        file_path.write_text(new_content, encoding='utf-8')
+        file_path.write_text(frontmatter + content, encoding='utf-8')
         return True
     except Exception:
         return False
 
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate Morphir Rust documentation structure"
@@ -245,9 +520,14 @@ def main():
     parser.add_argument('path', nargs='?', default=None,
                         help="Path to validate (default: docs/)")
     parser.add_argument('--fix', action='store_true',
-                        help="Attempt to fix common issues")
+                        help="Attempt to fix common issues (files validated "
+                             "serially are not read again to fix them)")
     parser.add_argument('--verbose', '-v', action='store_true',
                         help="Show detailed output")
+    parser.add_argument('--jobs', '-j', type=positive_int, default=os.cpu_count(),
+                        help="Number of worker processes (default: CPU count, 1 = serial)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f"Validate every file without reading or writing {CACHE_FILE_NAME}")
 
     args = parser.parse_args()
 
@@ -270,53 +550,67 @@ def main():
     print(f"Validating documentation in: {target}")
     print("")
 
-    all_errors: List[ValidationError] = []
+    # Errors are streamed: only counts, the first few for display and the
+    # ones --fix acts on are kept
+    error_counts: Counter = Counter()
+    shown_errors: List[ValidationError] = []
+    fixable_errors: List[ValidationError] = []
     files_checked = 0
 
     # Collect files to check
     if target.is_file():
-        files = [target]
+        files = [file_info(str(target))]
     else:
-        files = list(target.rglob('*.md'))
+        files = list(iter_markdown_files(str(target)))
 
-    for file_path in files:
-        if args.verbose:
-            print(f"Checking: {file_path.relative_to(docs_root) if docs_root in file_path.parents else file_path}")
+    # Results of unchanged files are reused from the previous run
+    cache_file = project_root / CACHE_FILE_NAME
+    cache = None if args.no_cache else load_cache(cache_file, docs_root)
+
+    docs_root_prefix = str(docs_root) + os.sep
 
-        errors = validate_file(file_path, docs_root, args.verbose)
-        all_errors.extend(errors)
+    for file_path, errors in validate_files(files, docs_root, args.jobs, cache, keep_content=args.fix):
+        if args.verbose:
+            if file_path.startswith(docs_root_prefix):
+                print(f"Checking: {file_path[len(docs_root_prefix):]}")
+            else:
+                print(f"Checking: {file_path}")
+
+        for error in errors:
+            error_counts[error.error_type] += 1
+            if len(shown_errors) < 20:  # Limit output
+                shown_errors.append(error)
+            if args.fix and error.fixable and error.error_type == "MISSING_FRONTMATTER":
+                fixable_errors.append(error)
         files_checked += 1
 
+    if cache is not None:
+        save_cache(cache_file, docs_root, cache)
+
     # Report results
     print(f"Checked {files_checked} files")
     print("")
 
-    if not all_errors:
+    total_errors = sum(error_counts.values())
+    if not total_errors:
         print("✅ All validations passed!")
         sys.exit(0)
 
-    # Group errors by type
-    errors_by_type: Dict[str, List[ValidationError]] = {}
-    for error in all_errors:
-        if error.error_type not in errors_by_type:
-            errors_by_type[error.error_type] = []
-        errors_by_type[error.error_type].append(error)
-
-    print(f"❌ Found {len(all_errors)} issues:")
+    print(f"❌ Found {total_errors} issues:")
     print("")
 
-    for error_type, errors in errors_by_type.items():
-        print(f"  {error_type}: {len(errors)}")
+    for error_type, count in error_counts.items():
+        print(f"  {error_type}: {count}")
 
     print("")
 
     # Show details
-    for error in all_errors[:20]:  # Limit output
-        print(error)
+    for error in shown_errors:
+        print(format_error(error))
         print("")
 
-    if len(all_errors) > 20:
-        print(f"... and {len(all_errors) - 20} more issues")
+    if total_errors > len(shown_errors):
+        print(f"... and {total_errors - len(shown_errors)} more issues")
 
     # Fix if requested
     if args.fix:
@@ -324,11 +618,10 @@ def main():
         print("Attempting fixes...")
         fixed_count = 0
 
-        for error in all_errors:
-            if error.fixable and error.error_type == "MISSING_FRONTMATTER":
-                if fix_missing_frontmatter(Path(error.file_path)):
-                    print(f"  Fixed: {error.file_path}")
-                    fixed_count += 1
+        for error in fixable_errors:
+            if fix_missing_frontmatter(Path(error.file_path)):
+                print(f"  Fixed: {error.file_path}")
+                fixed_count += 1
 
         print(f"Fixed {fixed_count} issues")
 
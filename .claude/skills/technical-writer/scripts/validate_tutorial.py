@@ -69,6 +69,8 @@ RECOMMENDED_SECTIONS = [
     'conclusion',
 ]
 
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+
 
 def extract_frontmatter(content: str) -> tuple[Optional[Dict], str]:
     """Extract YAML frontmatter from content."""
@@ -92,7 +94,10 @@ def extract_headings(content: str) -> List[tuple[int, str, int]]:
     headings = []
     lines = content.split('\n')
     for i, line in enumerate(lines, 1):
-        match = re.match(r'^(#{1,6})\s+(.+)$', line)
+        # Most lines are not headings; skip them before the regex
+        if not line.startswith('#'):
+            continue
+        match = _HEADING_RE.match(line)
         if match:
             level = len(match.group(1))
             title = match.group(2).strip()